@@ -1,13 +1,74 @@
 """WeatherAPI client for external weather data."""
 
+from contextlib import asynccontextmanager
+import httpx
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 from weather_module.models.models import WeatherData
-from typing import List
+from typing import AsyncIterator, Iterable, List, Optional
 from weather_module.models.models import Location
+from weather_module.cache.memory_cache import MemoryCache
 from weather_module.logging_config import get_logger
 
 logger = get_logger("api.weather_client")
 
+# requests' default Accept-Encoding already advertises "br" when brotli is installed.
+_DEFAULT_HEADERS = {"Accept": "application/json"}
+
+# (WeatherData field, key in the API "current" block, default, treat "" as missing)
+_CURRENT_FIELDS = (
+    ("temp_c", "temp_c", None, False),
+    ("temp_f", "temp_f", None, False),
+    ("clouds", "cloud", 0, False),
+    ("wind_speed_kph", "wind_kph", 0.0, False),
+    ("wind_degree", "wind_degree", None, True),
+    ("wind_dir", "wind_dir", None, False),
+    ("pressure_mb", "pressure_mb", None, True),
+    ("pressure_in", "pressure_in", None, True),
+    ("precip_mm", "precip_mm", None, True),
+    ("precip_in", "precip_in", None, True),
+    ("humidity", "humidity", None, True),
+    ("feelslike_c", "feelslike_c", None, True),
+    ("feelslike_f", "feelslike_f", None, True),
+    ("vis_km", "vis_km", None, True),
+    ("vis_miles", "vis_miles", None, True),
+    ("uv", "uv", None, True),
+    ("gust_kph", "gust_kph", None, True),
+    ("gust_mph", "gust_mph", None, True),
+    ("last_updated", "last_updated", None, False),
+)
+
+# Split once at import time so _build_kwargs does not branch per field.
+_PLAIN_FIELDS = tuple((attr, key, default) for attr, key, default, coerce_empty in _CURRENT_FIELDS if not coerce_empty)
+_NUMERIC_FIELDS = tuple((attr, key) for attr, key, _, coerce_empty in _CURRENT_FIELDS if coerce_empty)
+
+
+def _nz(value, default=None):
+    """Treat missing or empty-string API values as absent."""
+    return default if value is None or value == "" else value
+
+
+def _build_kwargs(location_block: dict, current_block: dict) -> dict:
+    """Map WeatherAPI location/current blocks to WeatherData keyword arguments."""
+    loc_get = location_block.get
+    kwargs = {
+        "country": location_block["country"],
+        "state": loc_get("region") or None,
+        "city": location_block["name"],
+        "time_zone": loc_get("tz_id") or None,
+        "temp_k": None,
+    }
+    cb_get = current_block.get
+    for attr, key, default in _PLAIN_FIELDS:
+        kwargs[attr] = cb_get(key, default)
+    for attr, key in _NUMERIC_FIELDS:
+        kwargs[attr] = _nz(cb_get(key))
+    return kwargs
+
 class WeatherClientError(Exception):
     """Raised when the WeatherAPI client encounters an error."""
     def __init__(self, message: str):
@@ -17,10 +78,61 @@ class WeatherClientError(Exception):
 class WeatherClient:
     """WeatherAPI client for external weather data."""
 
-    def __init__(self, api_key: str, base_url: str = "https://api.weatherapi.com/v1", timeout: int = 10):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.weatherapi.com/v1",
+        timeout: int = 10,
+        pool_connections: int = 16,
+        pool_maxsize: int = 32,
+        max_retries: int = 3,
+        async_client: Optional[httpx.AsyncClient] = None,
+        revalidation_ttl: int = 3600,
+    ):
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
+        # Shared async client (e.g. owned by the FastAPI app); not closed here.
+        self.async_client = async_client
+        # query -> (etag, last_modified, WeatherData) from the last 200 response,
+        # used to send conditional GETs and reuse the body on 304 Not Modified.
+        self.revalidation_ttl = revalidation_ttl
+        self._validators = MemoryCache()
+
+        # One pooled session per client so TCP/TLS connections are kept alive
+        # and reused across calls instead of reconnecting on every request.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.headers.update(_DEFAULT_HEADERS)
+        self.session.mount(
+            base_url,
+            HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "WeatherClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @asynccontextmanager
+    async def _async_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared async client, or a short-lived one if none was given."""
+        if self.async_client is not None:
+            yield self.async_client
+            return
+        async with httpx.AsyncClient(http2=True, headers=_DEFAULT_HEADERS, timeout=self.timeout) as client:
+            yield client
 
     def get_current_weather_bulk(self, locations: List[Location]) -> List[WeatherData]:
         """Get current weather data for a list of locations.
@@ -35,55 +147,97 @@ class WeatherClient:
             logger.debug("Empty locations list provided, returning empty list")
             return []
 
-        logger.info(f"Fetching bulk weather data for {len(locations)} locations")
-        
-        url = f"{self.base_url}/current.json"
-        params = {
-            "key": self.api_key,
-            "q": "bulk",
-        }
-
-        bulk_locations = []
-        id_to_index: dict[str, int] = {}
-
-        for idx, loc in enumerate(locations):
-            q = loc.to_query()
-            custom_id = str(idx)
-            id_to_index[custom_id] = idx
-
-            bulk_locations.append({
-                "q": q,
-                "custom_id": custom_id,
-            })
-            logger.debug(f"Added location {idx}: {q}")
-
-        body = {"locations": bulk_locations}
-
-        logger.debug(f"Sending bulk request to {url}")
+        url, params, body = self._bulk_request(locations)
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 params=params,
-                json=body,
+                data=body,
+                headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
+                stream=True,
             )
-            logger.debug(f"Received response with status code {response.status_code}")
         except requests.RequestException as e:
-            logger.error(f"Network error during bulk weather request: {e}")
-            raise WeatherClientError(f"Network error: {e}") from e
+            raise self._network_error(e) from e
+        self._check_bulk_response(response)
+
+        # Stream the body and build WeatherData one bulk item at a time instead
+        # of buffering and parsing the whole payload up front. The body is read
+        # here rather than in session.post, so transport errors can still occur.
+        try:
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, "bulk.item", use_float=True)
+            return self._parse_bulk(items, len(locations))
+        except (urllib3.exceptions.HTTPError, requests.RequestException) as e:
+            raise self._network_error(e) from e
+        except ijson.JSONError as e:
+            logger.error("Invalid JSON in bulk weather response: %s", e)
+            raise WeatherClientError(f"Invalid bulk weather response: {e}") from e
+        finally:
+            response.close()
 
+    async def get_current_weather_bulk_async(self, locations: List[Location]) -> List[WeatherData]:
+        """Async counterpart of get_current_weather_bulk."""
+        if not locations:
+            logger.debug("Empty locations list provided, returning empty list")
+            return []
+
+        url, params, body = self._bulk_request(locations)
+        try:
+            async with self._async_session() as client:
+                response = await client.post(
+                    url,
+                    params=params,
+                    content=body,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.timeout,
+                )
+        except httpx.HTTPError as e:
+            raise self._network_error(e) from e
+        self._check_bulk_response(response)
+
+        raw = orjson.loads(response.content)
+        return self._parse_bulk(raw.get("bulk", []), len(locations))
+
+    def _bulk_request(self, locations: List[Location]) -> tuple[str, dict, bytes]:
+        """URL, query params and encoded body for a bulk request."""
+        logger.info("Fetching bulk weather data for %s locations", len(locations))
+        url = f"{self.base_url}/current.json"
+        params = {
+            "key": self.api_key,
+            "q": "bulk",
+        }
+        body = self._build_bulk_body(locations)
+        logger.debug("Sending bulk request to %s", url)
+        return url, params, body
+
+    def _check_bulk_response(self, response) -> None:
+        """Raise WeatherClientError unless a bulk response (requests or httpx) succeeded."""
+        logger.debug("Received response with status code %s", response.status_code)
         if response.status_code != 200:
             error_msg = response.text
-            logger.error(f"Bulk weather request failed: {response.status_code} - {error_msg}")
+            logger.error("Bulk weather request failed: %s - %s", response.status_code, error_msg)
             raise WeatherClientError(
                 f"Failed bulk weather request: {response.status_code} {error_msg}"
             )
 
-        raw = response.json()
-        bulk_items = raw.get("bulk", [])
-        logger.debug(f"Processing {len(bulk_items)} bulk items from API response")
+    def _build_bulk_body(self, locations: List[Location]) -> bytes:
+        """Build the encoded bulk request body. Each custom_id is the input index."""
+        bulk_locations: list = [None] * len(locations)
+
+        for idx, loc in enumerate(locations):
+            q = loc.to_query()
+            bulk_locations[idx] = {"q": q, "custom_id": str(idx)}
+            logger.debug("Added location %s: %s", idx, q)
+
+        return orjson.dumps({"locations": bulk_locations})
+
+    def _parse_bulk(self, bulk_items: Iterable[dict], count: int) -> List[WeatherData]:
+        """Map bulk response items back to WeatherData objects in input order."""
+        logger.debug("Processing bulk items from API response")
 
-        results: List[WeatherData] = [None] * len(locations) 
+        results: List[WeatherData] = [None] * count
+        n_ok = 0
 
         for item in bulk_items:
             query_block = item.get("query", {})
@@ -91,45 +245,20 @@ class WeatherClient:
             location_block = query_block.get("location", {})
             current_block = query_block.get("current", {})
 
-            if custom_id is None or custom_id not in id_to_index:
-                logger.warning(f"Skipping item with invalid custom_id: {custom_id}")
+            try:
+                idx = int(custom_id)
+            except (TypeError, ValueError):
+                idx = -1
+            if not 0 <= idx < count:
+                logger.warning("Skipping item with invalid custom_id: %s", custom_id)
                 continue
 
-            idx = id_to_index[custom_id]
-
-            def get_numeric(key, default=None):
-                value = current_block.get(key)
-                return value if value is not None and value != "" else default
-
-            results[idx] = WeatherData(
-                country=location_block["country"],
-                state=location_block.get("region") or None,
-                city=location_block["name"],
-                time_zone=location_block.get("tz_id") or None,
-                temp_c=current_block.get("temp_c"),
-                temp_f=current_block.get("temp_f"),
-                temp_k=None,
-                clouds=current_block.get("cloud", 0),
-                wind_speed_kph=current_block.get("wind_kph", 0.0),
-                wind_degree=get_numeric("wind_degree"),
-                wind_dir=current_block.get("wind_dir"),
-                pressure_mb=get_numeric("pressure_mb"),
-                pressure_in=get_numeric("pressure_in"),
-                precip_mm=get_numeric("precip_mm"),
-                precip_in=get_numeric("precip_in"),
-                humidity=get_numeric("humidity"),
-                feelslike_c=get_numeric("feelslike_c"),
-                feelslike_f=get_numeric("feelslike_f"),
-                vis_km=get_numeric("vis_km"),
-                vis_miles=get_numeric("vis_miles"),
-                uv=get_numeric("uv"),
-                gust_kph=get_numeric("gust_kph"),
-                gust_mph=get_numeric("gust_mph"),
-                last_updated=current_block.get("last_updated"),
-            )
-            logger.debug(f"Processed weather data for location {idx}: {location_block.get('name')}")
+            if results[idx] is None:
+                n_ok += 1
+            results[idx] = WeatherData(**_build_kwargs(location_block, current_block))
+            logger.debug("Processed weather data for location %s: %s", idx, location_block.get('name'))
 
-        logger.info(f"Successfully fetched bulk weather data for {len([r for r in results if r is not None])} locations")
+        logger.info("Successfully fetched bulk weather data for %s locations", n_ok)
         return results
 
 
@@ -148,59 +277,102 @@ class WeatherClient:
         Raises:
             WeatherClientError: If the request fails.
         """
-        logger.info(f"Fetching current weather for query: {query}")
-        
+        logger.info("Fetching current weather for query: %s", query)
+        url, params, headers, validators = self._current_request(query)
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise self._network_error(e, query) from e
+        return self._handle_current_response(query, response, validators)
+
+    async def get_current_weather_async(self, query: str) -> WeatherData:
+        """Async counterpart of get_current_weather."""
+        logger.info("Fetching current weather for query: %s", query)
+        async with self._async_session() as client:
+            return await self._fetch_current(client, query)
+
+    async def _fetch_current(self, client: httpx.AsyncClient, query: str) -> WeatherData:
+        """Fetch and parse current weather for a single query on the given async client."""
+        url, params, headers, validators = self._current_request(query)
+        try:
+            response = await client.get(url, params=params, headers=headers, timeout=self.timeout)
+        except httpx.HTTPError as e:
+            raise self._network_error(e, query) from e
+        return self._handle_current_response(query, response, validators)
+
+    def _current_request(self, query: str) -> tuple[str, dict, dict, Optional[tuple]]:
+        """URL, query params and conditional headers for a current.json request.
+
+        Also returns the stored validator entry the headers were built from,
+        so a 304 is answered from that entry even if it is evicted meanwhile.
+        """
         url = f"{self.base_url}/current.json"
         params = {
             "key": self.api_key,
             "q": query,
         }
-        
-        logger.debug(f"Sending request to {url} with query={query}")
-        try:
-            response = requests.get(url, params=params, timeout=self.timeout)
-            logger.debug(f"Received response with status code {response.status_code}")
-        except requests.RequestException as e:
-            logger.error(f"Network error during weather request for '{query}': {e}")
-            raise WeatherClientError(f"Network error: {e}") from e
-        
+        logger.debug("Sending request to %s with query=%s", url, query)
+        validators = self._validators.get(query)
+        return url, params, self._conditional_headers(validators), validators
+
+    def _handle_current_response(self, query: str, response, validators: Optional[tuple]) -> WeatherData:
+        """Turn a current.json response (requests or httpx) into WeatherData.
+
+        Reuses the stored body on 304 and raises WeatherClientError on any
+        other non-200 status.
+        """
+        logger.debug("Received response with status code %s", response.status_code)
+        if response.status_code == 304:
+            return self._not_modified(query, validators)
+
         if response.status_code != 200:
             error_msg = response.text
-            logger.error(f"WeatherAPI request failed for '{query}': {response.status_code} - {error_msg}")
+            logger.error("WeatherAPI request failed for '%s': %s - %s", query, response.status_code, error_msg)
             raise WeatherClientError(f"WeatherAPI request failed: {response.status_code} {error_msg}")
-        
-        raw = response.json()
+
+        data = self._parse_current(orjson.loads(response.content), query)
+        return self._remember(query, response.headers, data)
+
+    def _network_error(self, error: Exception, query: Optional[str] = None) -> WeatherClientError:
+        """Log a transport error and wrap it in WeatherClientError for the caller to raise."""
+        if query is None:
+            logger.error("Network error during bulk weather request: %s", error)
+        else:
+            logger.error("Network error during weather request for '%s': %s", query, error)
+        return WeatherClientError(f"Network error: {error}")
+
+    def _conditional_headers(self, validators: Optional[tuple]) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a stored validator entry."""
+        if validators is None:
+            return {}
+        etag, last_modified, _ = validators
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _remember(self, query: str, headers, data: WeatherData) -> WeatherData:
+        """Store the response validators for a query, if the server sent any."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators.set(query, (etag, last_modified, data), self.revalidation_ttl)
+        return data
+
+    def _not_modified(self, query: str, validators: Optional[tuple]) -> WeatherData:
+        """Return the stored body the request was validated against and extend its lifetime."""
+        if validators is None:
+            raise WeatherClientError(f"WeatherAPI returned 304 for '{query}' without a stored response")
+        logger.debug("Weather data not modified for '%s', reusing stored response", query)
+        self._validators.set(query, validators, self.revalidation_ttl)
+        return validators[2]
+
+    def _parse_current(self, raw: dict, query: str) -> WeatherData:
+        """Build WeatherData from a current.json response body."""
         location_block = raw["location"]
         current_block = raw["current"]
-        logger.debug(f"Successfully retrieved weather data for {location_block.get('name', query)}")
-        
-        def get_numeric(key, default=None):
-            value = current_block.get(key)
-            return value if value is not None and value != "" else default
+        logger.debug("Successfully retrieved weather data for %s", location_block.get('name', query))
         
-        return WeatherData(
-            country=location_block["country"],
-            state=location_block.get("region") or None,
-            city=location_block["name"],
-            time_zone=location_block.get("tz_id") or None,
-            temp_c=current_block.get("temp_c"),
-            temp_f=current_block.get("temp_f"),
-            temp_k=None,
-            clouds=current_block.get("cloud", 0),
-            wind_speed_kph=current_block.get("wind_kph", 0.0),
-            wind_degree=get_numeric("wind_degree"),
-            wind_dir=current_block.get("wind_dir"),
-            pressure_mb=get_numeric("pressure_mb"),
-            pressure_in=get_numeric("pressure_in"),
-            precip_mm=get_numeric("precip_mm"),
-            precip_in=get_numeric("precip_in"),
-            humidity=get_numeric("humidity"),
-            feelslike_c=get_numeric("feelslike_c"),
-            feelslike_f=get_numeric("feelslike_f"),
-            vis_km=get_numeric("vis_km"),
-            vis_miles=get_numeric("vis_miles"),
-            uv=get_numeric("uv"),
-            gust_kph=get_numeric("gust_kph"),
-            gust_mph=get_numeric("gust_mph"),
-            last_updated=current_block.get("last_updated"),
-        )
\ No newline at end of file
+        return WeatherData(**_build_kwargs(location_block, current_block))
\ No newline at end of file
@@ -1,30 +1,56 @@
 """In-memory caching implementation."""
 
-from typing import Optional, Any
+from collections import OrderedDict
+from typing import Callable, Optional, Any, Hashable
+import threading
 import time
 
 class MemoryCache:
-    """In-memory caching implementation."""
+    """In-memory caching implementation.
 
-    def __init__(self):
-        self.cache: dict[str, dict[str, Any]] = {}
+    Entries expire after their TTL and the cache is bounded to ``max_entries``;
+    when full, the least recently used entry is evicted on ``set``.
+    Safe to share between threads (e.g. FastAPI's sync handler threadpool).
+    ``time_fn`` is the clock used for expiry; it defaults to ``time.monotonic``
+    and can be replaced with a fake clock in tests.
+    """
 
-    def get(self, key: str) -> Optional[Any]:
+    def __init__(self, max_entries: Optional[int] = 10_000, time_fn: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._time_fn = time_fn
+        # Values in LRU order (oldest first) and their expiry times on the
+        # time_fn clock, kept in parallel so expiry checks don't unpack tuples.
+        self._values: OrderedDict[Hashable, Any] = OrderedDict()
+        self._expiry: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get a value from the cache if not expired."""
-        entry = self.cache.get(key)
-        if not entry:
-            return None
-
-        if entry["expires_at"] < time.time():
-            del self.cache[key]
-            return None
-
-        return entry["value"]
-
-    def set(self, key: str, value: Any, ttl: int = 3600):
-        """Set a value with TTL (seconds)."""
-        expires_at = time.time() + ttl
-        self.cache[key] = {
-            "value": value,
-            "expires_at": expires_at,
-        }
\ No newline at end of file
+        with self._lock:
+            expires_at = self._expiry.get(key)
+            if expires_at is None:
+                return None
+
+            if expires_at < self._time_fn():
+                del self._expiry[key]
+                del self._values[key]
+                return None
+
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def set(self, key: Hashable, value: Any, ttl: int = 3600):
+        """Set a value with TTL (seconds), evicting the oldest entry if full."""
+        expires_at = self._time_fn() + ttl
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            self._expiry[key] = expires_at
+            if self.max_entries is not None and len(self._values) > self.max_entries:
+                oldest, _ = self._values.popitem(last=False)
+                del self._expiry[oldest]
+
+    def expires_at(self, key: Hashable) -> Optional[float]:
+        """Expiry time of ``key`` on the cache clock, or None if it isn't cached."""
+        with self._lock:
+            return self._expiry.get(key)
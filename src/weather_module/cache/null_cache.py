@@ -0,0 +1,17 @@
+"""No-op cache used when caching is disabled."""
+
+from typing import Optional, Any, Hashable
+
+
+class NullCache:
+    """Cache with the MemoryCache interface that never stores anything.
+
+    Lets callers use a cache unconditionally instead of checking for None.
+    """
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Always a miss."""
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: int = 3600):
+        """Discard the value."""
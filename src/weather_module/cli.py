@@ -87,7 +87,8 @@ def run(
     setup_logging(
         level=log_level, 
         log_file=settings.log_file,
-        log_to_console=settings.log_to_console
+        log_to_console=settings.log_to_console,
+        buffer_file_log=True,
     )
 
     logger.info("CLI run command invoked")
@@ -130,7 +131,8 @@ def main():
     setup_logging(
         level=settings.log_level, 
         log_file=settings.log_file,
-        log_to_console=settings.log_to_console
+        log_to_console=settings.log_to_console,
+        buffer_file_log=True,
     )
     logger.info("Weather Module CLI initialized")
     cli()
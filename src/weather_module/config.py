@@ -15,6 +15,7 @@ class Settings(BaseSettings):
     # Cache Configuration
     cache_enabled: bool = True
     cache_ttl_seconds: int = 300
+    cache_max_entries: int = 10_000
     
     # Server Configuration (optional)
     api_host: str = "0.0.0.0"
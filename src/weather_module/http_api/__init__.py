@@ -1,7 +1,10 @@
 """FastAPI HTTP layer package."""
 
+import httpx
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from .routes import router as weather_router
+from weather_module.api.weather_client import WeatherClient
 from weather_module.config import get_settings
 from weather_module.logging_config import setup_logging, get_logger
 
@@ -17,19 +20,28 @@ app = FastAPI(
     title="Weather Module API",
     description="HTTP API for querying weather data using the WeatherService.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize logging on application startup."""
+    """Initialize logging and the shared WeatherClient on application startup."""
     logger.info("Weather Module API server starting up")
+    app.state.http_client = httpx.AsyncClient(http2=True, headers={"Accept": "application/json"})
+    app.state.weather_client = WeatherClient(
+        api_key=settings.weather_api_key,
+        base_url=settings.weather_api_base_url,
+        async_client=app.state.http_client,
+    )
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log shutdown event."""
+    """Close the shared WeatherClient and log shutdown event."""
     logger.info("Weather Module API server shutting down")
+    app.state.weather_client.close()
+    await app.state.http_client.aclose()
 
 
 @app.get("/health")
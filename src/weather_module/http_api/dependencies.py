@@ -1,6 +1,8 @@
 """FastAPI dependencies."""
 
-from fastapi import Depends
+from functools import lru_cache
+
+from fastapi import Depends, Request
 
 from weather_module.config import get_settings
 from weather_module.api.weather_client import WeatherClient
@@ -8,18 +10,22 @@ from weather_module.services.weather_service import WeatherService
 from weather_module.cache.memory_cache import MemoryCache
 
 
-def get_weather_client(settings = Depends(get_settings)) -> WeatherClient:
-    return WeatherClient(
-        api_key=settings.weather_api_key,
-        base_url=settings.weather_api_base_url,
-    )
+def get_weather_client(request: Request) -> WeatherClient:
+    """Get the process-wide WeatherClient created at app startup."""
+    return request.app.state.weather_client
+
+
+@lru_cache()
+def _shared_cache(max_entries: int) -> MemoryCache:
+    """Process-wide cache shared by all requests."""
+    return MemoryCache(max_entries=max_entries)
 
 
 def get_cache(settings = Depends(get_settings)) -> MemoryCache | None:
-    """Get cache instance based on settings."""
+    """Get the shared cache instance based on settings."""
     if not settings.cache_enabled:
         return None
-    return MemoryCache()
+    return _shared_cache(settings.cache_max_entries)
 
 
 def get_weather_service(
@@ -1,10 +1,12 @@
 """FastAPI route definitions."""
 
+from operator import attrgetter
+
 from fastapi import APIRouter, Depends, Query, HTTPException
 from typing import Optional, List, Literal, Dict, Any
 
 from weather_module.models.models import Location, WeatherData, BulkWeatherRequest
-from weather_module.services.weather_service import WeatherService
+from weather_module.services.weather_service import WeatherService, normalize_units
 from weather_module.logging_config import get_logger
 from .dependencies import get_weather_service
 
@@ -16,26 +18,49 @@ router = APIRouter(
 )
 
 
+BASIC_FIELDS = (
+    "country", "state", "city", "time_zone",
+    "temp_c", "temp_f", "temp_k",
+    "clouds", "wind_speed_kph",
+)
+
+
+_get_basic = attrgetter(*BASIC_FIELDS)
+
+
+def _project_basic(data: WeatherData) -> Dict[str, Any]:
+    """Return only the basic fields of WeatherData."""
+    return dict(zip(BASIC_FIELDS, _get_basic(data)))
+
+
+def _project_full(data: WeatherData) -> Dict[str, Any]:
+    """Return all fields of WeatherData."""
+    # WeatherData is flat with primitive fields, so a shallow copy of the
+    # instance dict is equivalent to model_dump() without the serializer pass.
+    return dict(data.__dict__)
+
+
+def _validate_units(units: Optional[str]) -> Optional[str]:
+    """Normalize units, rejecting unknown values with a 400."""
+    if not units:
+        return units
+    try:
+        return normalize_units(units)
+    except ValueError as e:
+        logger.warning("Invalid units: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 def _filter_weather_data(data: WeatherData, detailed: bool) -> Dict[str, Any]:
     """Filter WeatherData to include only basic or all fields based on detailed flag."""
-    data_dict = data.model_dump()
-    
-    if not detailed:
-        basic_fields = {
-            "country", "state", "city", "time_zone",
-            "temp_c", "temp_f", "temp_k",
-            "clouds", "wind_speed_kph"
-        }
-        return {k: v for k, v in data_dict.items() if k in basic_fields}
-    
-    return data_dict
+    return _project_full(data) if detailed else _project_basic(data)
 
 
 @router.get(
     "/current",
     summary="Get current weather for a single location",
 )
-def get_current_weather(
+async def get_current_weather(
     city: Optional[str] = Query(None, description="City name, e.g. 'Berlin'"),
     country: Optional[str] = Query(None, description="Country name, e.g. 'Germany'"),
     state: Optional[str] = Query(None, description="State/region name"),
@@ -49,21 +74,22 @@ def get_current_weather(
     By default, returns basic weather data. Set detailed=true to include
     additional fields like pressure, humidity, UV index, wind direction, etc.
     """
-    logger.info(f"GET /weather/current - city={city}, country={country}, state={state}, "
-                f"zip_code={zip_code}, units={units}, detailed={detailed}")
+    logger.info("GET /weather/current - city=%s, country=%s, state=%s, zip_code=%s, units=%s, detailed=%s",
+                city, country, state, zip_code, units, detailed)
     
+    units = _validate_units(units)
     location = Location(city=city, country=country, state=state, zip_code=zip_code)
     try:
         query = location.to_query()
-        logger.debug(f"Location query: {query}")
+        logger.debug("Location query: %s", query)
     except ValueError as e:
-        logger.warning(f"Invalid location parameters: {e}")
+        logger.warning("Invalid location parameters: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     
     try:
-        weather_data = service.get_current_weather(location, units)
+        weather_data = await service.get_current_weather_async(location, units)
         filtered_data = _filter_weather_data(weather_data, detailed)
-        logger.info(f"Successfully retrieved weather data for {weather_data.city}")
+        logger.info("Successfully retrieved weather data for %s", weather_data.city)
         
         return {
             "data": filtered_data,
@@ -71,7 +97,7 @@ def get_current_weather(
             "status": 200
         }
     except Exception as e:
-        logger.error(f"Error fetching weather data: {e}", exc_info=True)
+        logger.error("Error fetching weather data: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch weather data: {str(e)}")
 
 
@@ -79,7 +105,7 @@ def get_current_weather(
     "/bulk",
     summary="Get current weather for multiple locations in a single request",
 )
-def get_current_weather_bulk(
+async def get_current_weather_bulk(
     request: BulkWeatherRequest,
     units: Optional[str] = Query("C", description="Temperature units: C, F, K, BOTH, ALL"),
     detailed: bool = Query(False, description="Include detailed weather data (pressure, humidity, UV, etc.)"),
@@ -92,28 +118,31 @@ def get_current_weather_bulk(
     - Returns a list of WeatherData in the same order as the input locations.
     - Set detailed=true to include additional fields.
     """
-    logger.info(f"POST /weather/bulk - locations={len(request.locations)}, "
-                f"units={units}, detailed={detailed}")
+    logger.info("POST /weather/bulk - locations=%s, units=%s, detailed=%s",
+                len(request.locations), units, detailed)
     
     if not request.locations:
         logger.warning("Bulk request received with empty locations list")
         raise HTTPException(status_code=400, detail="At least one location is required.")
 
+    units = _validate_units(units)
+
     for i, loc in enumerate(request.locations, start=1):
         try:
             query = loc.to_query()
-            logger.debug(f"Location {i}: {query}")
+            logger.debug("Location %s: %s", i, query)
         except ValueError as e:
-            logger.warning(f"Invalid location at index {i}: {e}")
+            logger.warning("Invalid location at index %s: %s", i, e)
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid location at index {i}: {e}",
             )
 
     try:
-        weather_data = service.get_current_weather_bulk(request.locations, units=units)
-        filtered_data = [_filter_weather_data(wd, detailed) for wd in weather_data]
-        logger.info(f"Successfully retrieved weather data for {len(filtered_data)} locations")
+        weather_data = await service.get_current_weather_bulk_async(request.locations, units=units)
+        project = _project_full if detailed else _project_basic
+        filtered_data = [project(wd) for wd in weather_data]
+        logger.info("Successfully retrieved weather data for %s locations", len(filtered_data))
         
         return {
             "data": filtered_data,
@@ -121,5 +150,5 @@ def get_current_weather_bulk(
             "status": 200
         }
     except Exception as e:
-        logger.error(f"Error fetching bulk weather data: {e}", exc_info=True)
+        logger.error("Error fetching bulk weather data: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch weather data: {str(e)}")
\ No newline at end of file
@@ -1,29 +1,46 @@
 """CSV file reading utilities."""
 
 import csv
+import os
+from contextlib import nullcontext
 from weather_module.models.models import Location
-from typing import Optional
+from typing import Optional, TextIO, Union
 from pydantic import ValidationError
 
+LOCATION_FIELDS = tuple(Location.model_fields.keys())
+
 
 class CSVReader:
     """CSV file reading utilities."""
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: Union[str, os.PathLike, TextIO]):
+        """file_path may also be an open text stream (e.g. io.StringIO); it is not closed."""
         self.file_path = file_path
 
-    def _clean_row(self, row: dict[str, str]) -> dict[str, Optional[str]]:
+    def _open(self):
+        if isinstance(self.file_path, (str, os.PathLike)):
+            return open(self.file_path, newline='', encoding='utf-8')
+        return nullcontext(self.file_path)
+
+    def _column_indexes(self, header: list[str]) -> list[tuple[str, Optional[int]]]:
+        """Resolve each Location field to its column index in the header (None if absent).
+        Computed once per file so rows can be read as plain lists.
+        """
+        positions = {name: i for i, name in enumerate(header)}
+        return [(field, positions.get(field)) for field in LOCATION_FIELDS]
+
+    def _clean_row(self, row: list[str], columns: list[tuple[str, Optional[int]]]) -> dict[str, Optional[str]]:
         """Clean CSV row:
             - Strip whitespaces
             - Convert empty strings to None
             - keep only fields that exist in Location model
             """
         cleaned_row: dict[str, Optional[str]] = {}
-        for field in Location.model_fields.keys():
-            value = row.get(field)
-            if value is None:
+        row_len = len(row)
+        for field, idx in columns:
+            if idx is None or idx >= row_len:
                 cleaned_row[field] = None
                 continue
-            value = value.strip()
+            value = row[idx].strip()
             cleaned_row[field] = value if value != "" else None
         return cleaned_row
 
@@ -38,15 +55,21 @@ class CSVReader:
             list[Location]: A list of Location objects.
         """
         locations: list[Location] = []
-        with open(self.file_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with self._open() as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return locations
+            columns = self._column_indexes(header)
             for row in reader:
-                cleaned_row = self._clean_row(row)
+                if not row:
+                    continue
+                cleaned_row = self._clean_row(row, columns)
                 try:
                     loc = Location(**cleaned_row)
                     locations.append(loc)
                 except ValidationError as e:
-                    print(f"Error parsing row: {row}")
+                    print(f"Error parsing row: {dict(zip(header, row))}")
                     print(f"Error: {e}")
                     continue
         return locations
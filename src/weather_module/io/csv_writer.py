@@ -1,20 +1,88 @@
 """CSV file writing utilities."""
 
 import csv
-from typing import Tuple
+import os
+import tempfile
+from contextlib import contextmanager, nullcontext, suppress
+from itertools import chain
+from operator import attrgetter
+from typing import Iterable, TextIO, Tuple, Union
 
 from weather_module.models.models import Location, WeatherData
 
+# Read once at import; os.umask can only be queried by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+LOCATION_ATTRS = ("country", "state", "city", "zip_code")
+BASIC_ATTRS = ("clouds", "wind_speed_kph")
+DETAILED_ATTRS = (
+    "wind_degree",
+    "wind_dir",
+    "pressure_mb",
+    "pressure_in",
+    "precip_mm",
+    "precip_in",
+    "humidity",
+    "feelslike_c",
+    "feelslike_f",
+    "vis_km",
+    "vis_miles",
+    "uv",
+    "gust_kph",
+    "gust_mph",
+    "last_updated",
+)
+
+
+def _fmt(value):
+    """Write missing values as empty cells."""
+    return "" if value is None else value
+
+
+@contextmanager
+def _replace_on_success(path):
+    """Write to a uniquely named temporary file next to ``path`` and move it into
+    place only if the block completes, so a failure mid-write never leaves a
+    truncated CSV."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with open(fd, "w", newline="", encoding="utf-8") as f:
+            yield f
+        # mkstemp creates the file owner-only; give the output the permissions
+        # a plain open() would have.
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
 class CSVWriter:
     """CSV file writing utilities."""
-    def __init__(self, file_path: str, units: str = "C", detailed: bool = False):
+    def __init__(self, file_path: Union[str, os.PathLike, TextIO], units: str = "C", detailed: bool = False):
+        """file_path may also be an open text stream (e.g. io.StringIO); it is not closed."""
         self.file_path = file_path
         self.units = units.upper()
         self.detailed = detailed
 
-    def write(self, data: list[Tuple[Location, WeatherData]]):
-        if not data:
-            return
+    def _open(self):
+        if isinstance(self.file_path, (str, os.PathLike)):
+            return _replace_on_success(self.file_path)
+        return nullcontext(self.file_path)
+
+    def write(self, data: Iterable[Tuple[Location, WeatherData]]) -> int:
+        """Write (Location, WeatherData) pairs and return the number of rows written.
+
+        Rows are written as they are produced, so ``data`` may be a generator
+        that is still fetching. Empty input writes no file, and if ``data``
+        raises, an output path is left untouched.
+        """
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            return 0
 
         temp_fields: list[str] = []
         if self.units in ("C", "BOTH", "ALL"):
@@ -24,72 +92,23 @@ class CSVWriter:
         if self.units in ("K", "ALL"):
             temp_fields.append("temp_k")
 
-        fieldnames = [
-            "country",
-            "state",
-            "city",
-            "zip_code",
-            *temp_fields,
-            "clouds",
-            "wind_speed_kph",
-        ]
-        
+        weather_attrs = (*temp_fields, *BASIC_ATTRS)
         if self.detailed:
-            detailed_fields = [
-                "wind_degree",
-                "wind_dir",
-                "pressure_mb",
-                "pressure_in",
-                "precip_mm",
-                "precip_in",
-                "humidity",
-                "feelslike_c",
-                "feelslike_f",
-                "vis_km",
-                "vis_miles",
-                "uv",
-                "gust_kph",
-                "gust_mph",
-                "last_updated",
-            ]
-            fieldnames.extend(detailed_fields)
-
-        with open(self.file_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for location, weather_data in data:
-                row = {
-                    "country": location.country or "",
-                    "state": location.state or "",
-                    "city": location.city or "",
-                    "zip_code": location.zip_code or "",
-                    "clouds": weather_data.clouds,
-                    "wind_speed_kph": weather_data.wind_speed_kph,
-                }
-
-                if "temp_c" in temp_fields:
-                    row["temp_c"] = "" if weather_data.temp_c is None else weather_data.temp_c
-                if "temp_f" in temp_fields:
-                    row["temp_f"] = "" if weather_data.temp_f is None else weather_data.temp_f
-                if "temp_k" in temp_fields:
-                    row["temp_k"] = "" if weather_data.temp_k is None else weather_data.temp_k
-
-                if self.detailed:
-                    row["wind_degree"] = "" if weather_data.wind_degree is None else weather_data.wind_degree
-                    row["wind_dir"] = "" if weather_data.wind_dir is None else weather_data.wind_dir
-                    row["pressure_mb"] = "" if weather_data.pressure_mb is None else weather_data.pressure_mb
-                    row["pressure_in"] = "" if weather_data.pressure_in is None else weather_data.pressure_in
-                    row["precip_mm"] = "" if weather_data.precip_mm is None else weather_data.precip_mm
-                    row["precip_in"] = "" if weather_data.precip_in is None else weather_data.precip_in
-                    row["humidity"] = "" if weather_data.humidity is None else weather_data.humidity
-                    row["feelslike_c"] = "" if weather_data.feelslike_c is None else weather_data.feelslike_c
-                    row["feelslike_f"] = "" if weather_data.feelslike_f is None else weather_data.feelslike_f
-                    row["vis_km"] = "" if weather_data.vis_km is None else weather_data.vis_km
-                    row["vis_miles"] = "" if weather_data.vis_miles is None else weather_data.vis_miles
-                    row["uv"] = "" if weather_data.uv is None else weather_data.uv
-                    row["gust_kph"] = "" if weather_data.gust_kph is None else weather_data.gust_kph
-                    row["gust_mph"] = "" if weather_data.gust_mph is None else weather_data.gust_mph
-                    row["last_updated"] = "" if weather_data.last_updated is None else weather_data.last_updated
-
-                writer.writerow(row)
+            weather_attrs += DETAILED_ATTRS
+
+        # Both getters return tuples since they always fetch 2+ attributes.
+        get_location = attrgetter(*LOCATION_ATTRS)
+        get_weather = attrgetter(*weather_attrs)
+
+        with self._open() as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow((*LOCATION_ATTRS, *weather_attrs))
+
+            count = 0
+            for location, weather_data in chain((first,), rows):
+                writer.writerow([
+                    *(value or "" for value in get_location(location)),
+                    *(_fmt(value) for value in get_weather(weather_data)),
+                ])
+                count += 1
+        return count
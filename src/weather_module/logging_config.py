@@ -1,16 +1,21 @@
 """Logging configuration for the weather module."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Number of log records held in memory before they are written to the log file.
+FILE_LOG_BUFFER_RECORDS = 1024
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
     format_string: Optional[str] = None,
     log_to_console: bool = True,
+    buffer_file_log: bool = False,
 ) -> logging.Logger:
     """
     Configure logging for the weather module.
@@ -20,6 +25,9 @@ def setup_logging(
         log_file: Optional path to log file. If None and log_to_console is False, no logging occurs.
         format_string: Optional custom format string for log messages.
         log_to_console: Whether to output logs to console. Default True.
+        buffer_file_log: Batch file log records in memory (for short-lived batch
+            runs such as the CLI). Off by default so a long-running server
+            writes every record as it happens.
     
     Returns:
         Configured logger instance.
@@ -48,14 +56,33 @@ def setup_logging(
         file_handler.setLevel(log_level)
         file_formatter = logging.Formatter(format_string)
         file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
+        if buffer_file_log:
+            # Batch records so per-row logging doesn't cost a write per line.
+            # Warnings and errors flush immediately, and the buffer is flushed
+            # on shutdown.
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=FILE_LOG_BUFFER_RECORDS,
+                flushLevel=logging.WARNING,
+                target=file_handler,
+            )
+            buffered_handler.setLevel(log_level)
+            handlers.append(buffered_handler)
+        else:
+            handlers.append(file_handler)
     
-    logging.basicConfig(
-        level=log_level,
-        format=format_string,
-        handlers=handlers,
-        force=True,
-    )
+    # Replace the root handlers in one pass so repeated calls never stack
+    # duplicates. Closing a MemoryHandler flushes it but leaves its target
+    # open, so the target is closed as well.
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    root.setLevel(log_level)
+    for handler in handlers:
+        root.addHandler(handler)
     
     logger = logging.getLogger("weather_module")
     logger.setLevel(log_level)
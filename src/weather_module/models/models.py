@@ -1,10 +1,26 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from datetime import datetime
 from typing import Optional
 
 
+# Attribute combinations tried in order by Location.to_query(); the first
+# one whose values are all set is joined with commas.
+_QUERY_PRIORITY = (
+    ("latitude", "longitude"),
+    ("zip_code",),
+    ("ip_address",),
+    ("city", "country"),
+    ("city", "state"),
+    ("city",),
+    ("state",),
+    ("country",),
+)
+
+
 class Location(BaseModel):
     """Location data model. Used for querying the weather data."""
+    model_config = ConfigDict(frozen=True)
+
     city: Optional[str] = None
     country: Optional[str] = None
     state: Optional[str] = None
@@ -13,29 +29,39 @@ class Location(BaseModel):
     latitude: Optional[float] = None
     longitude: Optional[float] = None
 
+    # Resolved once at construction: to_query() is called several times per
+    # location (validation, logging, cache key, request body).
+    _query: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        self._query = self._build_query()
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> "Location":
+        """Copy the location, rebuilding the query when fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._query = copied._build_query()
+        return copied
+
     def to_query(self) -> str:
         """Convert the location to a query string."""
-        if self.latitude and self.longitude:
-            return f"{self.latitude},{self.longitude}"
-        if self.zip_code:
-            return self.zip_code
-        if self.ip_address:
-            return self.ip_address
-        if self.city and self.country:
-            return f"{self.city},{self.country}"
-        if self.city and self.state:
-            return f"{self.city},{self.state}"
-        if self.city:
-            return self.city
-        if self.state:
-            return self.state
-        if self.country:
-            return self.country
-        raise ValueError("Location must have at least one valid attribute.")
+        if self._query is None:
+            raise ValueError("Location must have at least one valid attribute.")
+        return self._query
+
+    def _build_query(self) -> Optional[str]:
+        """Build the query string, or None if no attribute is set."""
+        for attrs in _QUERY_PRIORITY:
+            values = [getattr(self, attr) for attr in attrs]
+            if all(values):
+                return ",".join(map(str, values))
+        return None
 
 
 class WeatherData(BaseModel):
     """Weather data model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     country: str
     state: Optional[str] = None
     city: str
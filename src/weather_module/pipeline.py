@@ -1,9 +1,11 @@
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from weather_module.config import get_settings
 from weather_module.api.weather_client import WeatherClient
-from weather_module.services.weather_service import WeatherService
+from weather_module.services.weather_service import WeatherService, normalize_units
 from weather_module.io.csv_reader import CSVReader
 from weather_module.io.csv_writer import CSVWriter
 from weather_module.cache.memory_cache import MemoryCache
@@ -18,54 +20,95 @@ def run_pipeline(
     units: str = "C",
     use_cache: bool = True,
     cache_ttl: int = 900,
+    cache_max_entries: Optional[int] = None,
     max_rows: Optional[int] = None,
     verbose: bool = False,
     use_bulk: bool = False,
     detailed: bool = False,
+    max_workers: int = 8,
 ) -> None:
     """
     End-to-end pipeline:
     - read locations from input CSV
-    - fetch weather for each location (with optional cache)
-    - write enriched results to output CSV
+    - fetch weather for each location (with optional LRU cache bounded to
+      cache_max_entries, defaulting to the CACHE_MAX_ENTRIES setting), using up to
+      max_workers concurrent requests on the per-location path
+    - write enriched results to output CSV as they arrive
     """
-    logger.info(f"Starting pipeline: input={input_csv}, output={output_csv}, units={units}, "
-                f"cache={'enabled' if use_cache else 'disabled'}, bulk={use_bulk}, detailed={detailed}")
+    logger.info("Starting pipeline: input=%s, output=%s, units=%s, cache=%s, bulk=%s, detailed=%s",
+                input_csv, output_csv, units, "enabled" if use_cache else "disabled", use_bulk, detailed)
     
+    units = normalize_units(units)
     settings = get_settings()
     client = WeatherClient(
         api_key=settings.weather_api_key,
         base_url=settings.weather_api_base_url,
     )
-    cache = MemoryCache() if use_cache else None
+    if cache_max_entries is None:
+        cache_max_entries = settings.cache_max_entries
+    cache = MemoryCache(max_entries=cache_max_entries) if use_cache else None
+    # units are normalized once above and become the service default, so the
+    # per-row calls below don't re-normalize the same string.
     service = WeatherService(weather_client=client, cache=cache, cache_ttl=cache_ttl, default_units=units)
     logger.debug("Initialized WeatherClient and WeatherService")
 
-    logger.info(f"Reading locations from {input_csv}")
+    logger.info("Reading locations from %s", input_csv)
     reader = CSVReader(input_csv)
     locations = reader.read()
     
     if max_rows is not None:
         original_count = len(locations)
         locations = locations[:max_rows]
-        logger.info(f"Limited locations from {original_count} to {len(locations)} rows")
+        logger.info("Limited locations from %d to %d rows", original_count, len(locations))
     
-    logger.info(f"Read {len(locations)} locations from {input_csv}")
+    logger.info("Read %d locations from %s", len(locations), input_csv)
     
-    if use_bulk:
-        logger.info("Using bulk API endpoint for fetching weather data")
-        weather_list = service.get_current_weather_bulk(locations, units)
-    else:
-        logger.info("Using per-location API endpoint for fetching weather data")
-        weather_list = []
-        for i, loc in enumerate(locations, 1):
-            logger.debug(f"Fetching weather for location {i}/{len(locations)}: {loc.to_query()}")
-            weather_list.append(service.get_current_weather(loc, units))
-    
-    results = list(zip(locations, weather_list))
-    logger.info(f"Successfully fetched weather data for {len(results)} locations")
-    
-    logger.info(f"Writing results to {output_csv} (units={units}, detailed={detailed})")
+    logger.info("Writing results to %s (units=%s, detailed=%s)", output_csv, units, detailed)
     writer = CSVWriter(output_csv, units=units, detailed=detailed)
-    writer.write(results)
-    logger.info(f"Pipeline completed successfully. Wrote {len(results)} rows to {output_csv}")
\ No newline at end of file
+
+    try:
+        if use_bulk:
+            logger.info("Using bulk API endpoint for fetching weather data")
+            weather_list = service.get_current_weather_bulk(locations)
+            row_count = writer.write(zip(locations, weather_list))
+        else:
+            logger.info("Using per-location API endpoint for fetching weather data")
+
+            # Rows that resolve to the same query share one request.
+            keys = [loc.to_query() for loc in locations]
+            unique = dict(zip(keys, locations))
+            if len(unique) < len(locations):
+                logger.info("Fetching %d unique locations for %d rows", len(unique), len(locations))
+
+            # Checked once so rows don't build debug messages that would be dropped.
+            debug = logger.isEnabledFor(logging.DEBUG)
+            total = len(unique)
+
+            def fetch(indexed_loc):
+                i, loc = indexed_loc
+                if debug:
+                    logger.debug("Fetching weather for location %d/%d: %s", i, total, loc.to_query())
+                return service.get_current_weather(loc)
+
+            # Requests are network-bound and release the GIL, so threads overlap them.
+            # executor.map yields results in input order as they complete, so rows
+            # stream into the writer instead of being collected first.
+            workers = max(1, min(max_workers, len(unique)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                weather_iter = executor.map(fetch, enumerate(unique.values(), 1))
+                by_key = {}
+
+                def fan_out():
+                    # unique is ordered by first occurrence, so an unseen key is
+                    # always the next result from weather_iter.
+                    for loc, key in zip(locations, keys):
+                        if key not in by_key:
+                            by_key[key] = next(weather_iter)
+                        yield loc, by_key[key]
+
+                row_count = writer.write(fan_out())
+    finally:
+        client.close()
+
+    logger.info("Successfully fetched weather data for %d locations", row_count)
+    logger.info("Pipeline completed successfully. Wrote %d rows to %s", row_count, output_csv)
@@ -1,13 +1,91 @@
 """Weather service business logic."""
+import logging
+
 from weather_module.api.weather_client import WeatherClient
 from weather_module.models.models import WeatherData, Location
 from weather_module.cache.memory_cache import MemoryCache
-from typing import Optional, List
+from weather_module.cache.null_cache import NullCache
+from typing import Optional, List, Tuple
 from weather_module.logging_config import get_logger
 
 logger = get_logger("services.weather_service")
 
 
+def _c_to_k(c: float) -> float:
+    return c + 273.15
+
+
+def _f_to_k(f: float) -> float:
+    return (f - 32.0) * 5.0 / 9.0 + 273.15
+
+
+def _kelvin(wd: WeatherData) -> Optional[float]:
+    """Kelvin temperature derived from Celsius, or Fahrenheit if Celsius is missing."""
+    if wd.temp_c is not None:
+        return _c_to_k(wd.temp_c)
+    if wd.temp_f is not None:
+        return _f_to_k(wd.temp_f)
+    return None
+
+
+# Each handler returns WeatherData carrying only the requested temperatures.
+# WeatherData is frozen, so it is returned as-is when nothing needs changing.
+
+def _to_c(wd: WeatherData) -> WeatherData:
+    if wd.temp_f is None and wd.temp_k is None:
+        return wd
+    return wd.model_copy(update={"temp_f": None, "temp_k": None})
+
+
+def _to_f(wd: WeatherData) -> WeatherData:
+    if wd.temp_c is None and wd.temp_k is None:
+        return wd
+    return wd.model_copy(update={"temp_c": None, "temp_k": None})
+
+
+def _to_k(wd: WeatherData) -> WeatherData:
+    return wd.model_copy(update={"temp_c": None, "temp_f": None, "temp_k": _kelvin(wd)})
+
+
+def _to_both(wd: WeatherData) -> WeatherData:  # C + F
+    if wd.temp_k is None:
+        return wd
+    return wd.model_copy(update={"temp_k": None})
+
+
+def _to_all(wd: WeatherData) -> WeatherData:  # C + F + K
+    return wd.model_copy(update={"temp_k": _kelvin(wd)})
+
+
+_UNIT_HANDLERS = {
+    "C": _to_c,
+    "F": _to_f,
+    "K": _to_k,
+    "BOTH": _to_both,
+    "ALL": _to_all,
+}
+
+
+# Accepted spellings of each unit, mapped to the canonical (upper-case) name.
+_UNIT_NORMALIZE = {key: unit for unit in _UNIT_HANDLERS for key in (unit, unit.lower())}
+
+
+def normalize_units(units: str) -> str:
+    """Return the canonical name for ``units`` (case-insensitive).
+
+    Raises:
+        ValueError: If ``units`` is not one of C, F, K, BOTH or ALL.
+    """
+    normalized = _UNIT_NORMALIZE.get(units)
+    if normalized is None:
+        # Mixed case such as "Both" is rare enough to normalize the slow way.
+        normalized = _UNIT_NORMALIZE.get(units.upper())
+        if normalized is None:
+            raise ValueError(
+                f"Unsupported units '{units}'. Expected one of: {', '.join(_UNIT_HANDLERS)}"
+            )
+    return normalized
+
 
 class WeatherService:
     """Weather service business logic.
@@ -16,31 +94,19 @@ class WeatherService:
     """
     def __init__(self, weather_client: WeatherClient,cache=None, cache_ttl: int = 900, default_units: str = "C"):
         self.weather_client = weather_client
-        self.cache = cache
+        self.cache = cache if cache is not None else NullCache()
         self.cache_ttl = cache_ttl
-        self.default_units = default_units.upper()
+        self.default_units = normalize_units(default_units)
+        # Calls that don't override units use this without a table lookup.
+        self._convert_default = _UNIT_HANDLERS[self.default_units]
   
     def get_current_weather(self, location: Location, units: Optional[str] = None) -> WeatherData:
         """Get current weather data for a city."""
-        units = (units or self.default_units).upper()
-        query = location.to_query()
-        cache_key = f"{query}|units={units}"
-        
-        if self.cache:
-            cached_data = self.cache.get(cache_key)
-            if cached_data:
-                logger.debug(f"Cache hit for query: {query} (units={units})")
-                return cached_data
-            logger.debug(f"Cache miss for query: {query} (units={units})")
-        
-        logger.debug(f"Fetching weather data from API for: {query} (units={units})")
+        query, units, cached_data = self._cached(location, units)
+        if cached_data:
+            return cached_data
         data = self.weather_client.get_current_weather(query)
-        processed_data = self._apply_units(data, units)
-        
-        if self.cache:
-            logger.debug(f"Caching weather data for: {query} (units={units}, TTL={self.cache_ttl}s)")
-            self.cache.set(cache_key, processed_data, self.cache_ttl)
-        return processed_data
+        return self._store(query, units, data)
     
     
     def get_current_weather_bulk(
@@ -55,100 +121,74 @@ class WeatherService:
             logger.debug("Empty locations list provided to bulk method")
             return []
 
-        effective_units = (units or self.default_units).upper()
-        logger.info(f"Fetching bulk weather for {len(locations)} locations (units={effective_units})")
-
+        effective_units = self._bulk_units(locations, units)
         raw_results = self.weather_client.get_current_weather_bulk(locations)
+        return self._process_bulk(raw_results, effective_units)
 
-        processed: List[WeatherData] = []
-        for wd in raw_results:
-            if wd:
-                processed.append(self._apply_units(wd, effective_units))
+    async def get_current_weather_async(self, location: Location, units: Optional[str] = None) -> WeatherData:
+        """Async counterpart of get_current_weather, for the HTTP API event loop."""
+        query, units, cached_data = self._cached(location, units)
+        if cached_data:
+            return cached_data
+        data = await self.weather_client.get_current_weather_async(query)
+        return self._store(query, units, data)
 
-        logger.info(f"Successfully processed {len(processed)} weather results")
-        return processed
+    async def get_current_weather_bulk_async(
+        self,
+        locations: List[Location],
+        units: Optional[str] = None,
+    ) -> List[WeatherData]:
+        """Async counterpart of get_current_weather_bulk."""
+        if not locations:
+            logger.debug("Empty locations list provided to bulk method")
+            return []
 
+        effective_units = self._bulk_units(locations, units)
+        raw_results = await self.weather_client.get_current_weather_bulk_async(locations)
+        return self._process_bulk(raw_results, effective_units)
 
-    def _apply_units(self, wd: WeatherData, units: str) -> WeatherData:
-        """Return a WeatherData object consistent with configured units."""
-        def c_to_k(c: float) -> float:
-            return c + 273.15
-
-        def f_to_k(f: float) -> float:
-            return (f - 32.0) * 5.0 / 9.0 + 273.15
-
-        base_c = wd.temp_c
-        base_f = wd.temp_f
-
-        base_k: Optional[float] = None
-        if units in ("K", "ALL") and (base_c is not None or base_f is not None):
-            if base_c is not None:
-                base_k = c_to_k(base_c)
-            elif base_f is not None:
-                base_k = f_to_k(base_f)
-
-        common_fields = {
-            "country": wd.country,
-            "state": wd.state,
-            "city": wd.city,
-            "time_zone": wd.time_zone,
-            "clouds": wd.clouds,
-            "wind_speed_kph": wd.wind_speed_kph,
-            "wind_degree": wd.wind_degree,
-            "wind_dir": wd.wind_dir,
-            "pressure_mb": wd.pressure_mb,
-            "pressure_in": wd.pressure_in,
-            "precip_mm": wd.precip_mm,
-            "precip_in": wd.precip_in,
-            "humidity": wd.humidity,
-            "feelslike_c": wd.feelslike_c,
-            "feelslike_f": wd.feelslike_f,
-            "vis_km": wd.vis_km,
-            "vis_miles": wd.vis_miles,
-            "uv": wd.uv,
-            "gust_kph": wd.gust_kph,
-            "gust_mph": wd.gust_mph,
-            "last_updated": wd.last_updated,
-        }
-
-        if units == "C":
-            return WeatherData(
-                temp_c=base_c,
-                temp_f=None,
-                temp_k=None,
-                **common_fields,
-            )
+    def _cached(self, location: Location, units: Optional[str]) -> Tuple[str, str, Optional[WeatherData]]:
+        """Resolve the query and units for a request and look them up in the cache.
 
-        if units == "F":
-            return WeatherData(
-                temp_c=None,
-                temp_f=base_f,
-                temp_k=None,
-                **common_fields,
-            )
+        Returns (query, canonical units, cached data or None).
+        """
+        units = normalize_units(units) if units else self.default_units
+        query = location.to_query()
+        cached_data = self.cache.get((query, units))
 
-        if units == "K":
-            return WeatherData(
-                temp_c=None,
-                temp_f=None,
-                temp_k=base_k,
-                **common_fields,
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            if cached_data:
+                logger.debug("Cache hit for query: %s (units=%s)", query, units)
+            else:
+                logger.debug("Cache miss for query: %s (units=%s)", query, units)
+                logger.debug("Fetching weather data from API for: %s (units=%s)", query, units)
+        return query, units, cached_data
+
+    def _store(self, query: str, units: str, data: WeatherData) -> WeatherData:
+        """Convert freshly fetched data to ``units``, cache it and return it."""
+        processed_data = self._converter(units)(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Caching weather data for: %s (units=%s, TTL=%ss)", query, units, self.cache_ttl)
+        self.cache.set((query, units), processed_data, self.cache_ttl)
+        return processed_data
 
-        if units == "BOTH":  # C + F
-            return WeatherData(
-                temp_c=base_c,
-                temp_f=base_f,
-                temp_k=None,
-                **common_fields,
-            )
+    def _bulk_units(self, locations: List[Location], units: Optional[str]) -> str:
+        """Canonical units for a bulk request."""
+        effective_units = normalize_units(units) if units else self.default_units
+        logger.info("Fetching bulk weather for %d locations (units=%s)", len(locations), effective_units)
+        return effective_units
 
-        if units == "ALL":  # C + F + K
-            return WeatherData(
-                temp_c=base_c,
-                temp_f=base_f,
-                temp_k=base_k,
-                **common_fields,
-            )
+    def _process_bulk(self, raw_results: List[WeatherData], units: str) -> List[WeatherData]:
+        """Convert bulk results to ``units``, dropping locations without data."""
+        # Resolve the conversion once for the whole batch rather than per row.
+        convert = self._converter(units)
+        processed: List[WeatherData] = [convert(wd) for wd in raw_results if wd]
 
-        return wd
+        logger.info("Successfully processed %d weather results", len(processed))
+        return processed
+
+    def _converter(self, units: str):
+        """Unit conversion for ``units``, specialized at init for the default."""
+        if units == self.default_units:
+            return self._convert_default
+        return _UNIT_HANDLERS[units]
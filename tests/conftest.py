@@ -0,0 +1,54 @@
+"""Shared pytest fixtures."""
+
+import itertools
+
+import pytest
+from click.testing import CliRunner
+
+# Gives every requested path a distinct name inside the shared directory.
+_file_ids = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def tmp_base(tmp_path_factory):
+    """One temporary directory for the whole session; pytest removes it afterwards."""
+    return tmp_path_factory.mktemp("weather")
+
+
+@pytest.fixture
+def input_path(tmp_base):
+    """Path for a test's input CSV (not created)."""
+    return tmp_base / f"input_{next(_file_ids)}.csv"
+
+
+@pytest.fixture
+def output_path(tmp_base):
+    """Path for a test's output CSV (not created)."""
+    return tmp_base / f"output_{next(_file_ids)}.csv"
+
+
+@pytest.fixture
+def clock():
+    """Fake clock for MemoryCache(time_fn=...); tests move time by assigning clock[0]."""
+    return [1000.0]
+
+
+@pytest.fixture(scope="module")
+def cli_runner():
+    """CliRunner shared by the tests of a module; it holds no state between invokes.
+
+    stderr is captured separately, so result.output holds stdout only.
+    """
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture(scope="session")
+def london_input_csv(tmp_path_factory):
+    """Path to a one-row (London) input CSV, written once per session.
+
+    For tests that don't depend on the input contents; tests that do should
+    write their own file via input_path.
+    """
+    path = tmp_path_factory.mktemp("cli") / "london.csv"
+    path.write_text("country,city\nUnited Kingdom,London\n")
+    return str(path)
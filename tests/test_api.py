@@ -1,17 +1,17 @@
 """Tests for Weather API client."""
 
-import sys
-from pathlib import Path
+import asyncio
 from unittest.mock import Mock, patch
 import pytest
+import httpx
+import responses
+import orjson
 import requests
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
+from src.weather_module.api import weather_client
 from src.weather_module.api.weather_client import WeatherClient, WeatherClientError
-from src.weather_module.models.models import WeatherData
+from src.weather_module.models.models import Location
+from src.weather_module.cache.memory_cache import MemoryCache
 from src.weather_module.config import get_settings
 
 
@@ -40,19 +40,20 @@ class TestWeatherClient:
         # Arrange
         client = WeatherClient(api_key="test_key")
         
-        # Mock the requests.get call
-        with patch('requests.get') as mock_get:
+        # Mock the pooled session's GET call
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = MOCK_WEATHER_RESPONSE
+            mock_response.content = orjson.dumps(MOCK_WEATHER_RESPONSE)
             mock_response.text = ""
+            mock_response.headers = {}
             mock_get.return_value = mock_response
             
             # Act
             result = client.get_current_weather("London")
             
             # Assert
-            assert isinstance(result, WeatherData)
+            assert isinstance(result, weather_client.WeatherData)
             assert result.city == "London"
             assert result.country == "United Kingdom"
             assert result.temp_c == 15.5
@@ -63,7 +64,7 @@ class TestWeatherClient:
         # Arrange
         client = WeatherClient(api_key="test_key")
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_response.text = "Not Found"
@@ -81,13 +82,140 @@ class TestWeatherClient:
         # Arrange
         client = WeatherClient(api_key="test_key")
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
             
-            # Act & Assert
-            with pytest.raises(requests.exceptions.ConnectionError):
+            # Act & Assert - transport errors are wrapped by the client
+            with pytest.raises(WeatherClientError, match="Network error"):
                 client.get_current_weather("London")
 
+    @responses.activate
+    def test_get_current_weather_revalidates_with_etag(self):
+        """Test a 304 Not Modified response reuses the previously fetched data."""
+        # Arrange
+        client = WeatherClient(api_key="test_key")
+        url = "https://api.weatherapi.com/v1/current.json"
+        responses.add(responses.GET, url, body=orjson.dumps(MOCK_WEATHER_RESPONSE), headers={"ETag": '"v1"'})
+        responses.add(
+            responses.GET,
+            url,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+
+        # Act
+        first = client.get_current_weather("London")
+        second = client.get_current_weather("London")
+
+        # Assert
+        assert second == first
+        assert len(responses.calls) == 2
+        assert responses.calls[1].response.status_code == 304
+
+    @responses.activate
+    def test_get_current_weather_304_survives_validator_eviction(self):
+        """Test a 304 is answered from the entry the request was sent with, even if it was evicted meanwhile."""
+        # Arrange
+        client = WeatherClient(api_key="test_key")
+        url = "https://api.weatherapi.com/v1/current.json"
+        responses.add(responses.GET, url, body=orjson.dumps(MOCK_WEATHER_RESPONSE), headers={"ETag": '"v1"'})
+
+        def evict_then_not_modified(request):
+            # Another request evicts the stored entry while this one is in flight.
+            client._validators = MemoryCache()
+            return (304, {}, "")
+
+        responses.add_callback(responses.GET, url, callback=evict_then_not_modified)
+
+        # Act
+        first = client.get_current_weather("London")
+        second = client.get_current_weather("London")
+
+        # Assert
+        assert second == first
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_get_current_weather_bulk_maps_items_by_custom_id(self):
+        """Test streamed bulk response items are placed back in input order."""
+        # Arrange
+        client = WeatherClient(api_key="test_key")
+        locations = [Location(city="London"), Location(city="Paris"), Location(city="Nowhere")]
+        paris = {
+            "location": {**MOCK_WEATHER_RESPONSE["location"], "name": "Paris", "country": "France"},
+            "current": MOCK_WEATHER_RESPONSE["current"],
+        }
+        responses.add(
+            responses.POST,
+            "https://api.weatherapi.com/v1/current.json",
+            body=orjson.dumps({"bulk": [
+                {"query": {"custom_id": "1", **paris}},
+                {"query": {"custom_id": "0", **MOCK_WEATHER_RESPONSE}},
+            ]}),
+            status=200,
+        )
+
+        # Act
+        results = client.get_current_weather_bulk(locations)
+
+        # Assert
+        assert [r.city if r else None for r in results] == ["London", "Paris", None]
+        assert results[0].temp_c == 15.5
+
+    @responses.activate
+    def test_get_current_weather_bulk_truncated_body_raises_client_error(self):
+        """Test a connection dropped while the bulk body streams in is wrapped like other network errors."""
+        # Arrange - the server announces more bytes than it sends
+        client = WeatherClient(api_key="test_key")
+        body = orjson.dumps({"bulk": [{"query": {"custom_id": "0", **MOCK_WEATHER_RESPONSE}}]})
+        responses.add(
+            responses.POST,
+            "https://api.weatherapi.com/v1/current.json",
+            body=body[:40],
+            headers={"Content-Length": str(len(body))},
+        )
+
+        # Act & Assert
+        with pytest.raises(WeatherClientError, match="Network error"):
+            client.get_current_weather_bulk([Location(city="London")])
+
+    @responses.activate
+    def test_get_current_weather_bulk_invalid_json_raises_client_error(self):
+        """Test a malformed bulk body raises WeatherClientError instead of a parser error."""
+        # Arrange
+        client = WeatherClient(api_key="test_key")
+        responses.add(
+            responses.POST,
+            "https://api.weatherapi.com/v1/current.json",
+            body=b'{"bulk": [{"query": ',
+        )
+
+        # Act & Assert
+        with pytest.raises(WeatherClientError, match="Invalid bulk weather response"):
+            client.get_current_weather_bulk([Location(city="London")])
+
+    def test_get_current_weather_async_uses_shared_response_handling(self):
+        """Test the async path parses 200s and raises WeatherClientError on errors like the sync path."""
+        # Arrange - the injected async client answers from an in-memory transport
+        def handler(request):
+            if request.url.params["q"] == "InvalidCity":
+                return httpx.Response(404, text="Not Found")
+            return httpx.Response(200, content=orjson.dumps(MOCK_WEATHER_RESPONSE))
+
+        async def fetch(query):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+                client = WeatherClient(api_key="test_key", async_client=async_client)
+                return await client.get_current_weather_async(query)
+
+        # Act
+        result = asyncio.run(fetch("London"))
+
+        # Assert
+        assert result.city == "London"
+        assert result.temp_c == 15.5
+        with pytest.raises(WeatherClientError, match="404 Not Found"):
+            asyncio.run(fetch("InvalidCity"))
+
     @pytest.mark.integration
     def test_get_current_weather_real_api(self):
         """Test with real API call (requires API key in .env)."""
@@ -110,7 +238,7 @@ class TestWeatherClient:
         result = client.get_current_weather("London")
         
         # Assert
-        assert isinstance(result, WeatherData)
+        assert isinstance(result, weather_client.WeatherData)
         assert result.city == "London"
         assert result.country == "United Kingdom"
         assert result.temp_c is not None
@@ -1,393 +1,181 @@
 """Tests for CLI."""
 
-import sys
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from unittest.mock import patch, MagicMock
+import inspect
+import re
 import pytest
-import csv
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from click.testing import CliRunner
+from src.weather_module import cli as cli_module
 from src.weather_module.cli import cli
 
+# Resolved once, before any test patches run_pipeline out.
+PIPELINE_SIGNATURE = inspect.signature(cli_module.run_pipeline)
 
-class TestCLI:
-    """Essential tests for CLI."""
+# Lines printed by `run --verbose`, matched in a single pass over the output.
+VERBOSE_MARKERS = {"Running pipeline:", "input:", "output:", "Done."}
+VERBOSE_RE = re.compile("|".join(map(re.escape, VERBOSE_MARKERS)))
 
-    def test_cli_basic_run(self):
-        """Test basic CLI run command with input and output."""
-        # Arrange - Create temporary input CSV
-        input_csv_content = """country,city
-United Kingdom,London
-United States,New York"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            # Mock the pipeline to avoid actual API calls
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file])
-            
-            # Assert
-            assert result.exit_code == 0
-            mock_pipeline.assert_called_once()
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['input_csv'] == input_file
-            assert call_kwargs['output_csv'] == output_file
-            assert call_kwargs['units'] == 'C'  # default
-            assert call_kwargs['use_cache'] is True  # default
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
 
-    def test_cli_with_units_option_celsius(self):
-        """Test CLI with --units C option."""
-        # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--units', 'C'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['units'] == 'C'
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+class PipelineSpy:
+    """Stand-in for run_pipeline that records the keyword arguments of each call.
 
-    def test_cli_with_units_option_fahrenheit(self):
-        """Test CLI with --units F option."""
-        # Arrange
-        input_csv_content = """country,city
-United States,New York"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--units', 'F'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['units'] == 'F'
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+    Calls are checked against the real run_pipeline signature, so the CLI
+    can't pass arguments the pipeline doesn't accept.
+    """
 
-    def test_cli_with_units_option_both(self):
-        """Test CLI with --units both option."""
-        # Arrange
-        input_csv_content = """country,city
-France,Paris"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--units', 'both'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['units'] == 'BOTH'
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+    def __init__(self):
+        self.reset()
 
-    def test_cli_with_no_cache_flag(self):
-        """Test CLI with --no-cache flag."""
-        # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--no-cache'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['use_cache'] is False
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+    def reset(self):
+        """Forget recorded calls and stop raising."""
+        self.calls = []
+        self.error = None
 
-    def test_cli_with_ttl_option(self):
-        """Test CLI with --ttl option."""
-        # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--ttl', '600'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['cache_ttl'] == 600
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+    def __call__(self, **kwargs):
+        PIPELINE_SIGNATURE.bind(**kwargs)
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
 
-    def test_cli_with_max_rows_option(self):
-        """Test CLI with --max-rows option."""
+    @property
+    def kwargs(self):
+        """Keyword arguments of the most recent call."""
+        return self.calls[-1]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _installed_pipeline_spy():
+    """Replace run_pipeline once for the whole module so no API calls are made."""
+    spy = PipelineSpy()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cli_module, 'run_pipeline', spy)
+        yield spy
+
+
+@pytest.fixture
+def pipeline_spy(_installed_pipeline_spy):
+    """The module's run_pipeline spy, reset for this test."""
+    _installed_pipeline_spy.reset()
+    return _installed_pipeline_spy
+
+
+class TestCLI:
+    """Essential tests for CLI."""
+
+    def test_cli_basic_run(self, cli_runner, pipeline_spy, london_input_csv, output_path):
+        """Test basic CLI run command with input and output."""
         # Arrange
-        input_csv_content = """country,city
-United Kingdom,London
-United States,New York
-France,Paris
-Germany,Berlin"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
+        input_file = london_input_csv
+        output_file = str(output_path)
+        
+        # Act
+        result = cli_runner.invoke(cli, ['run', input_file, output_file], catch_exceptions=False)
+        
+        # Assert
+        assert result.exit_code == 0
+        assert len(pipeline_spy.calls) == 1
+        call_kwargs = pipeline_spy.kwargs
+        assert call_kwargs['input_csv'] == input_file
+        assert call_kwargs['output_csv'] == output_file
+        assert call_kwargs['units'] == 'C'  # default
+        assert call_kwargs['use_cache'] is True  # default
+
+    @pytest.mark.parametrize(
+        "cli_args, expected_kwargs",
+        [
+            (['--units', 'C'], {'units': 'C'}),
+            (['--units', 'F'], {'units': 'F'}),
+            (['--units', 'both'], {'units': 'BOTH'}),
+            (['--no-cache'], {'use_cache': False}),
+            (['--ttl', '600'], {'cache_ttl': 600}),
+            (['--max-rows', '2'], {'max_rows': 2}),
+            (['--detailed'], {'detailed': True}),
+            ([], {'detailed': False}),
+        ],
+        ids=['units-C', 'units-F', 'units-both', 'no-cache', 'ttl', 'max-rows', 'detailed', 'not-detailed'],
+    )
+    def test_cli_option_forwarding(self, cli_runner, pipeline_spy, london_input_csv, output_path, cli_args, expected_kwargs):
+        """Test that each CLI option is forwarded to run_pipeline."""
+        # Arrange
+        input_file = london_input_csv
+        output_file = str(output_path)
         
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
+        # Act
+        result = cli_runner.invoke(cli, ['run', input_file, output_file, *cli_args], catch_exceptions=False)
         
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--max-rows', '2'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['max_rows'] == 2
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+        # Assert
+        assert result.exit_code == 0
+        call_kwargs = pipeline_spy.kwargs
+        for key, value in expected_kwargs.items():
+            # Type check keeps flags strict (False, not 0).
+            assert call_kwargs[key] == value and type(call_kwargs[key]) is type(value)
 
-    def test_cli_with_verbose_flag(self):
+    def test_cli_with_verbose_flag(self, cli_runner, pipeline_spy, london_input_csv, output_path):
         """Test CLI with --verbose flag."""
         # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
+        input_file = london_input_csv
+        output_file = str(output_path)
         
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
+        # Act
+        result = cli_runner.invoke(cli, ['run', input_file, output_file, '--verbose'])
         
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--verbose'])
-            
-            # Assert
-            assert result.exit_code == 0
-            assert 'Running pipeline:' in result.output
-            assert 'input:' in result.output
-            assert 'output:' in result.output
-            assert 'Done.' in result.output
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['verbose'] is True
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+        # Assert
+        assert result.exit_code == 0
+        assert set(VERBOSE_RE.findall(result.output)) == VERBOSE_MARKERS
+        call_kwargs = pipeline_spy.kwargs
+        assert call_kwargs['verbose'] is True
 
-    def test_cli_error_handling(self):
+    def test_cli_error_handling(self, cli_runner, pipeline_spy, london_input_csv, output_path):
         """Test CLI error handling when pipeline fails."""
         # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
+        input_file = london_input_csv
+        output_file = str(output_path)
         
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
+        # Make the pipeline raise an error
+        pipeline_spy.error = Exception("Pipeline error")
         
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
+        # Act
+        result = cli_runner.invoke(cli, ['run', input_file, output_file])
         
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Mock pipeline to raise an error
-                mock_pipeline.side_effect = Exception("Pipeline error")
-                
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file])
-            
-            # Assert
-            assert result.exit_code == 1
-            assert 'Error:' in result.output
-            assert 'Pipeline error' in result.output
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+        # Assert
+        assert result.exit_code == 1
+        assert 'Error:' in result.stderr
+        assert 'Pipeline error' in result.stderr
 
-    def test_cli_missing_input_file(self):
+    def test_cli_missing_input_file(self, cli_runner):
         """Test CLI error when input file doesn't exist."""
-        # Arrange
-        runner = CliRunner()
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
+        # Act - Click rejects the input before the output path is used
+        result = cli_runner.invoke(cli, ['run', 'nonexistent.csv', 'unused.csv'])
         
-        try:
-            with patch('src.weather_module.cli.run_pipeline'):
-                # Act
-                result = runner.invoke(cli, ['run', 'nonexistent.csv', output_file])
-            
-            # Assert
-            assert result.exit_code != 0
-            assert 'nonexistent.csv' in result.output or 'does not exist' in result.output.lower()
-        finally:
-            Path(output_file).unlink(missing_ok=True)
+        # Assert
+        assert result.exit_code != 0
+        assert 'nonexistent.csv' in result.stderr or 'does not exist' in result.stderr.lower()
 
-    def test_cli_with_detailed_flag(self):
-        """Test CLI with --detailed flag."""
-        # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file, '--detailed'])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['detailed'] is True
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
-
-    def test_cli_without_detailed_flag(self):
-        """Test CLI without --detailed flag (default should be False)."""
-        # Arrange
-        input_csv_content = """country,city
-United Kingdom,London"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act
-                result = runner.invoke(cli, ['run', input_file, output_file])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['detailed'] is False
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
-
-    def test_cli_combined_options(self):
+    def test_cli_combined_options(self, cli_runner, pipeline_spy, london_input_csv, output_path):
         """Test CLI with multiple options combined."""
         # Arrange
-        input_csv_content = """country,city
-United Kingdom,London
-United States,New York"""
-        
-        with NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
-            f.write(input_csv_content)
-            input_file = f.name
-        
-        output_file = NamedTemporaryFile(mode='w', suffix='.csv', delete=False).name
-        
-        try:
-            runner = CliRunner()
-            
-            with patch('src.weather_module.cli.run_pipeline') as mock_pipeline:
-                # Act - Combine multiple options including --detailed
-                result = runner.invoke(cli, [
-                    'run',
-                    input_file,
-                    output_file,
-                    '--units', 'both',
-                    '--no-cache',
-                    '--ttl', '300',
-                    '--max-rows', '1',
-                    '--verbose',
-                    '--detailed'
-                ])
-            
-            # Assert
-            assert result.exit_code == 0
-            call_kwargs = mock_pipeline.call_args[1]
-            assert call_kwargs['units'] == 'BOTH'
-            assert call_kwargs['use_cache'] is False
-            assert call_kwargs['cache_ttl'] == 300
-            assert call_kwargs['max_rows'] == 1
-            assert call_kwargs['verbose'] is True
-            assert call_kwargs['detailed'] is True
-        finally:
-            Path(input_file).unlink(missing_ok=True)
-            Path(output_file).unlink(missing_ok=True)
+        input_file = london_input_csv
+        output_file = str(output_path)
+        
+        # Act - Combine multiple options including --detailed
+        result = cli_runner.invoke(cli, [
+            'run',
+            input_file,
+            output_file,
+            '--units', 'both',
+            '--no-cache',
+            '--ttl', '300',
+            '--max-rows', '1',
+            '--verbose',
+            '--detailed'
+        ], catch_exceptions=False)
+        
+        # Assert
+        assert result.exit_code == 0
+        call_kwargs = pipeline_spy.kwargs
+        assert call_kwargs['units'] == 'BOTH'
+        assert call_kwargs['use_cache'] is False
+        assert call_kwargs['cache_ttl'] == 300
+        assert call_kwargs['max_rows'] == 1
+        assert call_kwargs['verbose'] is True
+        assert call_kwargs['detailed'] is True
 
@@ -0,0 +1,85 @@
+"""Tests for MemoryCache."""
+
+from src.weather_module.cache.memory_cache import MemoryCache
+
+
+def _cache(clock, max_entries):
+    return MemoryCache(max_entries=max_entries, time_fn=lambda: clock[0])
+
+
+def _assert_evicted(cache, key):
+    """The key can neither be read nor has an expiry any more."""
+    assert cache.get(key) is None
+    assert cache.expires_at(key) is None
+
+
+class TestMemoryCache:
+    """Essential tests for MemoryCache."""
+
+    def test_evicts_least_recently_set_key_when_full(self, clock):
+        """Test that exceeding max_entries evicts the oldest entry."""
+        cache = _cache(clock, max_entries=2)
+        
+        # Act
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        
+        # Assert
+        _assert_evicted(cache, "a")
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+        assert cache.expires_at("b") is not None
+        assert cache.expires_at("c") is not None
+
+    def test_get_refreshes_recency(self, clock):
+        """Test that reading a key protects it from the next eviction."""
+        cache = _cache(clock, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        # Act - "a" is read, so "b" becomes the least recently used
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        
+        # Assert
+        _assert_evicted(cache, "b")
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_set_existing_key_refreshes_recency(self, clock):
+        """Test that overwriting a key counts as a use and doesn't grow the cache."""
+        cache = _cache(clock, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        # Act
+        cache.set("a", 10)
+        cache.set("c", 3)
+        
+        # Assert
+        _assert_evicted(cache, "b")
+        assert cache.get("a") == 10
+
+    def test_unbounded_when_max_entries_is_none(self, clock):
+        """Test that max_entries=None never evicts."""
+        cache = _cache(clock, max_entries=None)
+        
+        # Act
+        for i in range(1000):
+            cache.set(i, i)
+        
+        # Assert
+        assert all(cache.get(i) == i for i in range(1000))
+        assert all(cache.expires_at(i) is not None for i in range(1000))
+
+    def test_expired_entry_is_removed(self, clock):
+        """Test that an expired entry is dropped from both indexes on read."""
+        cache = _cache(clock, max_entries=2)
+        cache.set("a", 1, ttl=60)
+        
+        # Act
+        clock[0] += 61
+        
+        # Assert
+        _assert_evicted(cache, "a")
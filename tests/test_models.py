@@ -0,0 +1,60 @@
+"""Tests for data models."""
+
+import pytest
+
+from src.weather_module.models.models import Location
+
+# Every field set, so each case below removes the higher-priority ones.
+FULL_LOCATION = dict(
+    latitude=51.5074,
+    longitude=-0.1278,
+    zip_code="EC2Y 5AA",
+    ip_address="8.8.8.8",
+    city="London",
+    country="United Kingdom",
+    state="England",
+)
+
+
+class TestLocation:
+    """Essential tests for Location."""
+
+    @pytest.mark.parametrize(
+        "fields, expected_query",
+        [
+            (FULL_LOCATION, "51.5074,-0.1278"),
+            ({"latitude": 40.7128, "longitude": -74.006}, "40.7128,-74.006"),
+            ({"latitude": 10, "longitude": 20}, "10.0,20.0"),
+            ({**FULL_LOCATION, "longitude": None}, "EC2Y 5AA"),
+            ({**FULL_LOCATION, "latitude": None, "zip_code": None}, "8.8.8.8"),
+            ({"city": "London", "country": "United Kingdom", "state": "England"}, "London,United Kingdom"),
+            ({"city": "Springfield", "state": "Illinois"}, "Springfield,Illinois"),
+            ({"city": "London"}, "London"),
+            ({"state": "England", "country": "United Kingdom"}, "England"),
+            ({"country": "United Kingdom"}, "United Kingdom"),
+        ],
+        ids=[
+            'lat-long-first', 'lat-long-format', 'lat-long-ints', 'zip-code', 'ip-address',
+            'city-country', 'city-state', 'city', 'state', 'country',
+        ],
+    )
+    def test_to_query_priority(self, fields, expected_query):
+        """Test that to_query uses the highest-priority set of attributes."""
+        assert Location(**fields).to_query() == expected_query
+
+    def test_to_query_empty_location_raises(self):
+        """Test that a location without any attribute can't be queried."""
+        with pytest.raises(ValueError, match="at least one valid attribute"):
+            Location().to_query()
+
+    def test_model_copy_with_update_rebuilds_query(self):
+        """Test that model_copy(update=...) doesn't keep the original location's query."""
+        # Arrange
+        london = Location(city="London")
+        
+        # Act
+        paris = london.model_copy(update={"city": "Paris"})
+        
+        # Assert
+        assert paris.to_query() == "Paris"
+        assert london.to_query() == "London"
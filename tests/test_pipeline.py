@@ -0,0 +1,157 @@
+"""Tests for the CSV-to-CSV pipeline."""
+
+import csv
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from src.weather_module import pipeline
+from src.weather_module.api.weather_client import WeatherClientError
+from src.weather_module.models.models import WeatherData
+
+# Query for which the stubbed API fails.
+FAILING_QUERY = "Nowhere"
+
+# Distinct temperature per query, so each output row can be matched to its input.
+TEMPS_C = {"London": 15.0, "Paris": 20.0, "Berlin": 10.0, "Madrid": 25.0, "Rome": 22.0}
+
+# The first queries answer slowest, so with several workers results complete
+# in a different order from the input.
+DELAYS = {"London": 0.05, "Paris": 0.02}
+
+CITIES_WITH_DUPLICATES = ["London", "Paris", "London", "Berlin", "Paris", "London"]
+DISTINCT_CITIES = ["London", "Paris", "Berlin", "Madrid", "Rome"]
+
+
+def _weather_for(query):
+    """Deterministic weather for a query."""
+    return WeatherData(country="Testland", city=query, temp_c=TEMPS_C.get(query), clouds=50, wind_speed_kph=10.0)
+
+
+def _write_cities(path, cities):
+    path.write_text("city\n" + "".join(f"{city}\n" for city in cities))
+
+
+def _read_output(path):
+    """Output rows as (city, temp_c) pairs."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(row["city"], float(row["temp_c"])) for row in csv.DictReader(f)]
+
+
+class StubWeatherAPI:
+    """Stand-in for WeatherClient.get_current_weather that records queries and peak concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_current_weather(self, query):
+        with self._lock:
+            self.calls.append(query)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(DELAYS.get(query, 0))
+            if query == FAILING_QUERY:
+                raise WeatherClientError("API Error")
+            return _weather_for(query)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Route the pipeline's WeatherClient.get_current_weather calls to a StubWeatherAPI."""
+    monkeypatch.setenv("WEATHER_API_KEY", "test-key")
+    pipeline.get_settings.cache_clear()
+    stub = StubWeatherAPI()
+    monkeypatch.setattr(pipeline.WeatherClient, "get_current_weather", lambda self, query: stub.get_current_weather(query))
+    yield stub
+    pipeline.get_settings.cache_clear()
+
+
+class TestPipeline:
+    """Essential tests for the pipeline."""
+
+    def test_failed_fetch_leaves_no_output_file(self, api, input_path, tmp_path):
+        """Test that a fetch failing partway through leaves no truncated CSV or scratch file behind."""
+        # Arrange - the first row succeeds, the second fails; the user has an
+        # unrelated file next to the output that must survive
+        _write_cities(input_path, ["London", FAILING_QUERY, "Paris"])
+        output_path = tmp_path / "out.csv"
+        user_file = tmp_path / "out.csv.tmp"
+        user_file.write_text("keep me")
+        
+        # Act & Assert
+        with pytest.raises(WeatherClientError, match="API Error"):
+            pipeline.run_pipeline(str(input_path), str(output_path), max_workers=1)
+        
+        assert list(tmp_path.iterdir()) == [user_file]
+        assert user_file.read_text() == "keep me"
+
+    def test_output_file_has_default_permissions(self, api, input_path, output_path):
+        """Test that the written CSV isn't left with the scratch file's owner-only mode."""
+        _write_cities(input_path, ["London"])
+        umask = os.umask(0)
+        os.umask(umask)
+        
+        # Act
+        pipeline.run_pipeline(str(input_path), str(output_path))
+        
+        # Assert
+        assert stat.S_IMODE(output_path.stat().st_mode) == 0o666 & ~umask
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_duplicate_locations_fetched_once(self, api, input_path, output_path, max_workers):
+        """Test that rows resolving to the same query share a single API call."""
+        _write_cities(input_path, CITIES_WITH_DUPLICATES)
+        
+        # Act
+        pipeline.run_pipeline(str(input_path), str(output_path), max_workers=max_workers)
+        
+        # Assert - one call per distinct query
+        assert sorted(api.calls) == ["Berlin", "London", "Paris"]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_duplicate_rows_filled_in_input_order(self, api, input_path, output_path, max_workers):
+        """Test that every input row, duplicates included, is written in input order with its own query's weather."""
+        _write_cities(input_path, CITIES_WITH_DUPLICATES)
+        
+        # Act
+        pipeline.run_pipeline(str(input_path), str(output_path), max_workers=max_workers)
+        
+        # Assert
+        assert _read_output(output_path) == [(city, TEMPS_C[city]) for city in CITIES_WITH_DUPLICATES]
+
+    def test_output_independent_of_max_workers(self, api, input_path, output_path, tmp_base):
+        """Test that one worker and several workers write the same rows in the same order."""
+        _write_cities(input_path, DISTINCT_CITIES)
+        parallel_output = tmp_base / f"parallel_{output_path.name}"
+        
+        # Act
+        pipeline.run_pipeline(str(input_path), str(output_path), max_workers=1)
+        pipeline.run_pipeline(str(input_path), str(parallel_output), max_workers=4)
+        
+        # Assert
+        assert parallel_output.read_text() == output_path.read_text()
+        assert _read_output(output_path) == [(city, TEMPS_C[city]) for city in DISTINCT_CITIES]
+
+    @pytest.mark.parametrize("max_workers", [1, 2, 4])
+    def test_max_workers_bounds_concurrent_requests(self, api, input_path, output_path, max_workers):
+        """Test that requests overlap on the thread pool but never exceed max_workers."""
+        _write_cities(input_path, DISTINCT_CITIES)
+        
+        # Act
+        pipeline.run_pipeline(str(input_path), str(output_path), max_workers=max_workers)
+        
+        # Assert - London and Paris are slow, so several workers run them together
+        assert sorted(api.calls) == sorted(DISTINCT_CITIES)
+        assert api.max_in_flight <= max_workers
+        if max_workers > 1:
+            assert api.max_in_flight > 1
@@ -1,14 +1,7 @@
 """Tests for Weather Service."""
 
-import sys
-from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 import pytest
-import time
-
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.weather_module.models.models import Location, WeatherData
 from src.weather_module.services.weather_service import WeatherService
@@ -28,171 +21,174 @@ MOCK_WEATHER_DATA = WeatherData(
     wind_speed_kph=12.5
 )
 
+# What the service returns for MOCK_WEATHER_DATA with the default units (C)
+EXPECTED_WEATHER_C = MOCK_WEATHER_DATA.model_copy(update={"temp_f": None})
+
+
+@pytest.fixture(scope="module")
+def mock_weather_data():
+    """Immutable sample response shared by the module."""
+    return MOCK_WEATHER_DATA
+
+
+@pytest.fixture(scope="module")
+def location_london():
+    """Immutable London location shared by the module."""
+    return Location(city="London")
+
+
+class FakeClient:
+    """Minimal stand-in for WeatherClient.get_current_weather that records queries."""
+
+    def __init__(self, result=None, exc=None):
+        self.calls = []
+        self._result = result
+        self._exc = exc
+
+    def get_current_weather(self, query):
+        self.calls.append(query)
+        if self._exc:
+            raise self._exc
+        return self._result
+
+
+@pytest.fixture
+def fake_client(mock_weather_data):
+    """FakeClient returning mock_weather_data."""
+    return FakeClient(result=mock_weather_data)
+
+
+# Built once: speccing walks WeatherClient, so tests share this mock and reset it.
+_CLIENT_MOCK = Mock(spec=WeatherClient)
+
+
+@pytest.fixture
+def mock_client(mock_weather_data):
+    """WeatherClient mock returning mock_weather_data, with calls and side effects reset per test."""
+    _CLIENT_MOCK.reset_mock(return_value=True, side_effect=True)
+    _CLIENT_MOCK.get_current_weather.return_value = mock_weather_data
+    return _CLIENT_MOCK
+
+
+@pytest.fixture
+def cache(clock):
+    """Empty cache per test, on the fake clock."""
+    return MemoryCache(time_fn=lambda: clock[0])
+
 
 class TestWeatherService:
     """Essential tests for Weather Service."""
 
-    def test_get_current_weather_from_api_when_cache_miss(self):
-        """Test getting weather data from API when cache is empty."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.return_value = MOCK_WEATHER_DATA
-        
-        cache = MemoryCache()
-        service = WeatherService(weather_client=mock_client, cache=cache)
-        location = Location(city="London")
+    @pytest.mark.parametrize(
+        "cache_ttl, second_call_hits_api",
+        [(None, True), (900, False), (60, False)],
+        ids=['no-cache', 'ttl-900', 'ttl-60'],
+    )
+    def test_weather_service_cache_behavior(self, fake_client, cache, clock, location_london, cache_ttl, second_call_hits_api):
+        """Test that the first call hits the API and is cached with the configured TTL, so a second call within the TTL doesn't."""
+        # Arrange - a TTL of None means the service runs without a cache
+        if cache_ttl is None:
+            cache = None
+        service = WeatherService(weather_client=fake_client, cache=cache, cache_ttl=cache_ttl or 900)
+        cache_key = (location_london.to_query(), "C")
         
         # Act
-        result = service.get_current_weather(location)
-        
-        # Assert
-        assert isinstance(result, WeatherData)
-        assert result.city == "London"
-        assert result.country == "United Kingdom"
-        mock_client.get_current_weather.assert_called_once_with("London")
-
-    def test_get_current_weather_from_cache_when_cache_hit(self):
-        """Test getting weather data from cache when available (within TTL)."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.return_value = MOCK_WEATHER_DATA
-        
-        cache = MemoryCache()
-        service = WeatherService(weather_client=mock_client, cache=cache, cache_ttl=900)
-        location = Location(city="London")
+        first = service.get_current_weather(location_london)
         
-        # First call - populates cache
-        service.get_current_weather(location)
-        mock_client.reset_mock()
+        # Assert - First call always goes to the API
+        assert first == EXPECTED_WEATHER_C
+        assert fake_client.calls == ["London"]
         
-        # Act - Second call should use cache (within TTL)
-        result = service.get_current_weather(location)
+        if cache is not None:
+            # Entry is cached and expires exactly cache_ttl seconds from now
+            assert cache.get(cache_key) == EXPECTED_WEATHER_C
+            assert cache.expires_at(cache_key) == clock[0] + cache_ttl
         
-        # Assert - Client should not be called again (cache hit)
-        assert isinstance(result, WeatherData)
-        assert result.city == "London"
-        assert result.country == "United Kingdom"
-        mock_client.get_current_weather.assert_not_called()
-
-    def test_cache_is_set_after_api_call_with_ttl(self):
-        """Test that weather data is cached after API call with TTL."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.return_value = MOCK_WEATHER_DATA
-        
-        cache = MemoryCache()
-        service = WeatherService(weather_client=mock_client, cache=cache, cache_ttl=900)
-        location = Location(city="London")
-        query = location.to_query()
-        
-        # Verify cache is empty
-        assert cache.get(query) is None
-        
-        # Act - First call should cache the data with TTL
-        service.get_current_weather(location)
-        
-        # Assert - Cache should now contain the data (not expired)
-        cached_data = cache.get(query)
-        assert cached_data is not None
-        assert cached_data.city == "London"
-        assert cached_data.temp_c == 15.5
+        # Act - Second call is served from cache unless there is none
+        second = service.get_current_weather(location_london)
         
-        # Verify cache entry has expiration set
-        assert query in cache.cache
-        assert "expires_at" in cache.cache[query]
+        # Assert
+        assert second == first
+        assert len(fake_client.calls) == (2 if second_call_hits_api else 1)
 
-    def test_get_current_weather_handles_client_error(self):
+    def test_get_current_weather_handles_client_error(self, cache):
         """Test that service propagates errors from weather client."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.side_effect = WeatherClientError("API Error")
-        
-        cache = MemoryCache()
-        service = WeatherService(weather_client=mock_client, cache=cache)
+        client = FakeClient(exc=WeatherClientError("API Error"))
+        service = WeatherService(weather_client=client, cache=cache)
         location = Location(city="InvalidCity")
         
         # Act & Assert
-        with pytest.raises(WeatherClientError) as exc_info:
+        with pytest.raises(WeatherClientError, match="API Error"):
             service.get_current_weather(location)
-        
-        assert "API Error" in str(exc_info.value)
 
-    def test_cache_expires_after_ttl(self):
+    def test_cache_expires_after_ttl(self, fake_client, cache, clock, location_london):
         """Test that cached data expires after TTL and triggers new API call."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.return_value = MOCK_WEATHER_DATA
+        service = WeatherService(weather_client=fake_client, cache=cache, cache_ttl=60)  # 60 seconds TTL
         
-        cache = MemoryCache()
-        service = WeatherService(weather_client=mock_client, cache=cache, cache_ttl=60)  # 60 seconds TTL
-        location = Location(city="London")
-        
-        # Mock time BEFORE setting cache, so both set() and get() use mocked time
-        with patch('src.weather_module.cache.memory_cache.time.time') as mock_time:
-            # Start at time 1000
-            current_time = 1000.0
-            mock_time.return_value = current_time
-            
-            # First call - populates cache (expires at 1000 + 60 = 1060)
-            service.get_current_weather(location)
-            mock_client.reset_mock()
-            
-            # Advance time to 1061 (past expiration)
-            mock_time.return_value = 1061.0
-            
-            # Act - Should fetch from API again (cache expired)
-            result = service.get_current_weather(location)
-            
-            # Assert - Client should be called again (cache expired)
-            assert isinstance(result, WeatherData)
-            assert result.city == "London"
-            mock_client.get_current_weather.assert_called_once_with("London")
-
-    def test_cache_uses_correct_ttl(self):
-        """Test that service uses the configured TTL when setting cache."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.return_value = MOCK_WEATHER_DATA
+        # First call at time 1000 - populates cache (expires at 1000 + 60 = 1060)
+        service.get_current_weather(location_london)
         
-        cache = MemoryCache()
-        custom_ttl = 900  # 15 minutes = 900 seconds
-        service = WeatherService(weather_client=mock_client, cache=cache, cache_ttl=custom_ttl)
-        location = Location(city="London")
-        query = location.to_query()
+        # Advance time to 1061 (past expiration)
+        clock[0] = 1061.0
         
-        # Act - First call should cache with custom TTL
-        service.get_current_weather(location)
+        # Act - Should fetch from API again (cache expired)
+        result = service.get_current_weather(location_london)
         
-        # Assert - Verify cache entry has correct expiration time
-        assert query in cache.cache
-        entry = cache.cache[query]
-        assert "expires_at" in entry
+        # Assert - Client should be called again (cache expired)
+        assert result == EXPECTED_WEATHER_C
+        assert fake_client.calls == ["London", "London"]
+
+    @pytest.mark.parametrize(
+        "units, api_temps, expected_temps",
+        [
+            # API reports both scales
+            ("C", (15.5, 59.9), (15.5, None, None)),
+            ("F", (15.5, 59.9), (None, 59.9, None)),
+            ("K", (15.5, 59.9), (None, None, 288.65)),
+            ("BOTH", (15.5, 59.9), (15.5, 59.9, None)),
+            ("ALL", (15.5, 59.9), (15.5, 59.9, 288.65)),
+            ("all", (15.5, 59.9), (15.5, 59.9, 288.65)),
+            # Celsius only
+            ("C", (15.5, None), (15.5, None, None)),
+            ("F", (15.5, None), (None, None, None)),
+            ("K", (15.5, None), (None, None, 288.65)),
+            ("BOTH", (15.5, None), (15.5, None, None)),
+            ("ALL", (15.5, None), (15.5, None, 288.65)),
+            # Fahrenheit only - Kelvin falls back to converting from F
+            ("C", (None, 50.0), (None, None, None)),
+            ("F", (None, 50.0), (None, 50.0, None)),
+            ("K", (None, 50.0), (None, None, 283.15)),
+            ("BOTH", (None, 50.0), (None, 50.0, None)),
+            ("ALL", (None, 50.0), (None, 50.0, 283.15)),
+            # No temperature at all
+            ("K", (None, None), (None, None, None)),
+        ],
+    )
+    def test_get_current_weather_unit_conversion(self, location_london, units, api_temps, expected_temps):
+        """Test the temperatures returned for each unit, whether passed per call or as the service default."""
+        temp_c, temp_f = api_temps
+        client = FakeClient(result=MOCK_WEATHER_DATA.model_copy(update={"temp_c": temp_c, "temp_f": temp_f}))
+        per_call = WeatherService(weather_client=client, cache=None)
+        as_default = WeatherService(weather_client=client, cache=None, default_units=units)
         
-        # Check that expiration is approximately custom_ttl seconds from now
-        expected_expires_at = time.time() + custom_ttl
-        actual_expires_at = entry["expires_at"]
-        # Allow 1 second tolerance for test execution time
-        assert abs(actual_expires_at - expected_expires_at) < 2
-
-    def test_cache_works_without_cache_instance(self):
-        """Test that service works correctly when no cache is provided."""
-        # Arrange
-        mock_client = Mock(spec=WeatherClient)
-        mock_client.get_current_weather.return_value = MOCK_WEATHER_DATA
+        # Act
+        results = [
+            per_call.get_current_weather(location_london, units=units),
+            as_default.get_current_weather(location_london),
+        ]
         
-        # Service without cache
+        # Assert
+        for result in results:
+            assert (result.temp_c, result.temp_f, result.temp_k) == pytest.approx(expected_temps)
+            assert result.city == "London"
+
+    def test_get_current_weather_rejects_unknown_units(self, mock_client, location_london):
+        """Test that unsupported units raise instead of silently passing data through."""
         service = WeatherService(weather_client=mock_client, cache=None)
-        location = Location(city="London")
-        
-        # Act - Should work without cache
-        result = service.get_current_weather(location)
         
-        # Assert
-        assert isinstance(result, WeatherData)
-        assert result.city == "London"
-        mock_client.get_current_weather.assert_called_once_with("London")
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            service.get_current_weather(location_london, units="XYZ")
         
-        # Second call should still hit API (no cache)
-        mock_client.reset_mock()
-        result2 = service.get_current_weather(location)
-        mock_client.get_current_weather.assert_called_once_with("London")
+        assert "Unsupported units" in str(exc_info.value)
+        mock_client.get_current_weather.assert_not_called()